@@ -3,18 +3,49 @@ import joblib
 import pandas as pd
 import numpy as np
 import os
+import sys
+import threading
 from math import radians, cos, sin, asin, sqrt
 
+if __name__ == '__main__' and not __package__:
+    # Run as `python app/app.py`: make the project's sibling modules importable
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from features import FEATURES, crime_type_index, encode_crime_type, with_time_features
+from monitoring import DriftMonitor, PROFILE_PATH, load_profile
+
 # ---------------------------
-# Load model and scaler
+# Load model, scaler and encoder
 # ---------------------------
 MODEL_PATH = os.path.join(os.path.dirname(__file__), "../models/crime_hotspot_model.pkl")
 SCALER_PATH = os.path.join(os.path.dirname(__file__), "../models/scaler.pkl")
-
-model = joblib.load(MODEL_PATH)
-scaler = joblib.load(SCALER_PATH)
-
-FEATURES = ['latitude','longitude','hour','day_of_week','crime_type_enc','severity']
+ENCODER_PATH = os.path.join(os.path.dirname(__file__), "../models/encoder.pkl")
+
+_artifacts = {}
+# Threaded servers can race on the first requests; build each artifact once
+_artifacts_lock = threading.Lock()
+
+def load_artifacts():
+    """Unpickle the model, scaler and crime type encoder on first use instead of at import."""
+    if 'model' not in _artifacts:
+        with _artifacts_lock:
+            if 'model' not in _artifacts:
+                _artifacts['scaler'] = joblib.load(SCALER_PATH)
+                _artifacts['crime_types'] = crime_type_index(joblib.load(ENCODER_PATH).classes_)
+                # Set last: its presence marks the artifacts as fully loaded
+                _artifacts['model'] = joblib.load(MODEL_PATH)
+    return _artifacts['model'], _artifacts['scaler'], _artifacts['crime_types']
+
+def get_monitor():
+    """Drift monitor over live traffic, or None if no reference profile exists."""
+    if 'monitor' not in _artifacts:
+        with _artifacts_lock:
+            if 'monitor' not in _artifacts:
+                if os.path.exists(PROFILE_PATH):
+                    _artifacts['monitor'] = DriftMonitor(load_profile(PROFILE_PATH))
+                else:
+                    _artifacts['monitor'] = None
+    return _artifacts['monitor']
 
 # ---------------------------
 # Haversine distance function
@@ -31,17 +62,26 @@ def haversine(lat1, lon1, lat2, lon2):
 # ---------------------------
 # Prepare incoming data
 # ---------------------------
-def prepare(df):
+def encode_crime_types(df):
+    """crime_type codes per row; None where it is missing or unknown."""
+    _, _, crime_types = load_artifacts()
+    raw = df['crime_type'] if 'crime_type' in df.columns else [None] * len(df)
+    return [encode_crime_type(v, crime_types) for v in raw]
+
+def prepare(df, codes):
+    """Scale the training FEATURES; missing values and unknown crime types become 0."""
     df = df.copy()
-    df['crime_type_enc'] = 0
-    if 'severity' not in df.columns:
-        df['severity'] = 0
-    for c in ['latitude','longitude','hour','day_of_week','severity','crime_type_enc']:
+    _, scaler, _ = load_artifacts()
+    unknown = sum(c is None for c in codes)
+    if unknown:
+        # Debug only: the drift monitor warns once per window (zero_encoded_rate)
+        app.logger.debug("%d of %d rows have a missing or unknown crime_type; encoded as 0", unknown, len(df))
+    df['crime_type_encoded'] = [0 if c is None else c for c in codes]
+    for c in FEATURES:
         if c not in df.columns:
             df[c] = 0
-    num_cols = ['latitude','longitude','hour','day_of_week','severity']
-    df[num_cols] = scaler.transform(df[num_cols])
-    return df[FEATURES]
+    X = df[FEATURES].apply(pd.to_numeric, errors='coerce').fillna(0)
+    return scaler.transform(X)
 
 # ---------------------------
 # Flask app
@@ -59,13 +99,24 @@ def predict_hotspots():
 
     # Handle single dict or list of dicts
     if isinstance(payload, dict):
-        df = pd.DataFrame([payload])
+        records = [payload]
     elif isinstance(payload, list):
-        df = pd.DataFrame(payload)
+        records = payload
     else:
         return jsonify({"error":"Invalid payload format"}), 400
+    records = [with_time_features(r) if isinstance(r, dict) else r for r in records]
+    df = pd.DataFrame(records)
+    codes = encode_crime_types(df)
 
-    X = prepare(df)
+    # Watch the features before prepare() fills the gaps with 0
+    monitor = get_monitor()
+    if monitor is not None:
+        for r, code in zip(records, codes):
+            if isinstance(r, dict):
+                monitor.observe(dict(r, crime_type_encoded=code))
+
+    X = prepare(df, codes)
+    model, _, _ = load_artifacts()
 
     # Safe handling if model has only one class
     if len(model.classes_) > 1:
@@ -83,6 +134,16 @@ def predict_hotspots():
     out = df.sort_values('risk_score', ascending=False).head(topn)
     return jsonify(out.to_dict(orient='records'))
 
+# ---------------------------
+# Drift report
+# ---------------------------
+@app.route('/api/drift', methods=['GET'])
+def drift_report():
+    monitor = get_monitor()
+    if monitor is None:
+        return jsonify({"error":"No reference profile; retrain to create one"}), 404
+    return jsonify(monitor.report() or {"rows": monitor.seen, "warnings": []})
+
 # ---------------------------
 # Patrol allocation
 # ---------------------------
@@ -0,0 +1,181 @@
+"""Command line entry point for the crime hotspot services.
+
+    python cli.py train [--data PATH] [--models DIR]
+    python cli.py score-file INPUT [-o OUTPUT] [--topn N]
+    python cli.py serve [--host HOST] [--port PORT]
+    python cli.py drift INPUT [--window N] [--min-rows N]
+    python cli.py bench [--repeat N]
+
+Only argparse and the stdlib are imported here; each command pulls in its
+own dependencies when it runs, so `score-file` never loads pandas or sklearn.
+"""
+import argparse
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# ---------------------------
+# Commands
+# ---------------------------
+def cmd_train(args):
+    import train_model
+    train_model.main(data_path=args.data, model_dir=args.models)
+
+
+def cmd_score_file(args):
+    import scoring
+    n = scoring.score_file(args.input, args.output, args.topn, args.model)
+    print(f"Scored {n} rows", file=sys.stderr)
+
+
+def cmd_serve(args):
+    from app.app import app, load_artifacts
+    load_artifacts()
+    app.run(host=args.host, port=args.port, debug=args.debug)
+
+
+def cmd_drift(args):
+    import csv
+    import json
+    import monitoring
+    from features import with_time_features
+    monitor = monitoring.DriftMonitor(
+        monitoring.load_profile(args.profile), window=args.window, min_rows=args.min_rows
+    )
+    with open(args.input, newline="") as f:
+        for row in csv.DictReader(f):
+            monitor.observe(with_time_features(row))
+    print(json.dumps(monitor.flush(), indent=2))
+
+
+# ---------------------------
+# Benchmark: import time and time to first prediction
+# ---------------------------
+SAMPLE = {"latitude": 12.9345, "longitude": 77.6101, "hour": 22, "day_of_week": 4, "crime_type": "theft"}
+
+PROBES = {
+    "train": "import train_model",
+    "score-file": (
+        "import scoring\n"
+        "m = scoring.ArrayModel()\n"
+        "m.predict_proba([[{latitude}, {longitude}, {hour}, {day_of_week}, 0]])\n"
+    ).format(**SAMPLE),
+    "serve": (
+        "from app.app import app\n"
+        "r = app.test_client().post('/api/predict_hotspots', json=[{sample!r}])\n"
+        "assert r.status_code == 200, r.status_code\n"
+    ).format(sample=SAMPLE),
+}
+
+IMPORTTIME_RE = r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)"
+
+
+def parse_importtime(stderr):
+    """Split -X importtime output into (total self µs, top-level imports, other lines).
+
+    Top-level imports are (cumulative µs, module) pairs, heaviest first.
+    """
+    import re
+    self_us = 0
+    top_level = []
+    other = []
+    for line in stderr.splitlines():
+        m = re.match(IMPORTTIME_RE, line)
+        if m:
+            self_us += int(m.group(1))
+            if len(m.group(3)) == 1:
+                top_level.append((int(m.group(2)), m.group(4)))
+        elif not line.startswith("import time:"):
+            other.append(line)
+    top_level.sort(reverse=True)
+    return self_us, top_level, other
+
+
+def run_probe(name):
+    """Run one probe in a fresh interpreter under -X importtime."""
+    import subprocess
+    import time
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBES[name]],
+        cwd=BASE_DIR, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+
+    self_us, top_level, errors = parse_importtime(proc.stderr)
+    return {
+        "ok": proc.returncode == 0,
+        "wall": wall,
+        "imports": self_us / 1e6,
+        "top": top_level[:3],
+        "error": errors[-1] if errors else "",
+    }
+
+
+def cmd_bench(args):
+    names = args.commands or list(PROBES)
+    unknown = [n for n in names if n not in PROBES]
+    if unknown:
+        sys.exit(f"unknown bench command(s): {', '.join(unknown)}")
+    print(f"{'command':<12}{'imports (s)':>12}{'first pred (s)':>16}  heaviest imports")
+    for name in names:
+        runs = [run_probe(name) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["wall"])
+        if not best["ok"]:
+            print(f"{name:<12}{'failed':>12}{'':>16}  {best['error']}")
+            continue
+        # train only measures imports; fitting is not a "first prediction"
+        first = "-" if name == "train" else f"{best['wall']:.3f}"
+        top = ", ".join(f"{mod} {us / 1e3:.0f}ms" for us, mod in best["top"])
+        print(f"{name:<12}{best['imports']:>12.3f}{first:>16}  {top}")
+
+
+# ---------------------------
+# Argument parsing
+# ---------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="Crime hotspot services")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("train", help="train the model and export NumPy arrays")
+    p.add_argument("--data", default=os.path.join(BASE_DIR, "data", "crime_data.csv"))
+    p.add_argument("--models", default=os.path.join(BASE_DIR, "models"))
+    p.set_defaults(func=cmd_train)
+
+    p = sub.add_parser("score-file", help="score a CSV with the NumPy-only model")
+    p.add_argument("input")
+    p.add_argument("-o", "--output", help="output CSV (default: stdout)")
+    p.add_argument("--topn", type=int)
+    p.add_argument("--model", default=os.path.join(BASE_DIR, "models", "crime_hotspot_model.npz"))
+    p.set_defaults(func=cmd_score_file)
+
+    p = sub.add_parser("serve", help="run the Flask API")
+    p.add_argument("--host", default="0.0.0.0")
+    p.add_argument("--port", type=int, default=5002)
+    p.add_argument("--debug", action="store_true")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("drift", help="compare a CSV with the training reference profile")
+    p.add_argument("input")
+    p.add_argument("--window", type=int, default=500)
+    p.add_argument("--min-rows", type=int, default=100, help="rows needed before PSI warnings")
+    p.add_argument("--profile", default=os.path.join(BASE_DIR, "models", "reference_profile.json"))
+    p.set_defaults(func=cmd_drift)
+
+    p = sub.add_parser("bench", help="measure import time and time to first prediction")
+    p.add_argument("commands", nargs="*", metavar="COMMAND", help=", ".join(PROBES))
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Puts crime_hotspot_project/ on sys.path so tests can import train_model, scoring, app.app, ...
@@ -0,0 +1,40 @@
+"""Feature helpers shared by the Flask API, scoring.py and the CLI.
+
+Stdlib only, so importing this never pulls in pandas or NumPy.
+"""
+from datetime import datetime
+
+# Model inputs, in the order the scaler and forest were fitted on
+FEATURES = ["latitude", "longitude", "hour", "day_of_week", "crime_type_encoded"]
+# Raw categorical columns profiled next to FEATURES, and the feature each one encodes
+PROFILE_CATEGORICAL = {"crime_type": "crime_type_encoded"}
+
+
+def with_time_features(row):
+    """Fill hour and/or day_of_week from an ISO `time` field when missing.
+
+    Raw exports (like data/crime_data.csv) carry only `time`. Only the missing
+    field is filled, so an explicitly supplied value is never overwritten;
+    rows with neither gap nor a parseable time are returned unchanged.
+    """
+    missing = [f for f in ("hour", "day_of_week") if row.get(f) in (None, "")]
+    if not missing or not row.get("time"):
+        return row
+    try:
+        t = datetime.fromisoformat(str(row["time"]))
+    except ValueError:
+        return row
+    derived = {"hour": t.hour, "day_of_week": t.weekday()}
+    return dict(row, **{f: derived[f] for f in missing})
+
+
+def crime_type_index(classes):
+    """Map each training crime type (LabelEncoder.classes_ order) to its code."""
+    return {str(c): i for i, c in enumerate(classes)}
+
+
+def encode_crime_type(value, index):
+    """Code for one crime type, or None when it is missing or unseen in training."""
+    if value is None or value != value or value == "":
+        return None
+    return index.get(str(value))
@@ -0,0 +1,268 @@
+import json
+import logging
+import math
+import os
+import threading
+from bisect import bisect_right
+
+from features import crime_type_index, encode_crime_type
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_PATH = os.path.join(BASE_DIR, "models", "reference_profile.json")
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------
+# Streaming sketches (constant memory, O(1) updates)
+# ---------------------------
+class RunningStats:
+    """Welford running mean/variance plus min and max."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class BinnedSketch:
+    """Counts values into the reference quantile bins.
+
+    The bin edges come from the training profile, so the counts double as a
+    quantile sketch of live traffic and as the input to PSI.
+    """
+
+    def __init__(self, edges):
+        self.edges = list(edges)
+        self.counts = [0] * (len(self.edges) + 1)
+
+    def add(self, x):
+        self.counts[bisect_right(self.edges, x)] += 1
+
+    def fractions(self):
+        total = sum(self.counts)
+        return [c / total for c in self.counts] if total else [0.0] * len(self.counts)
+
+    def quantile(self, q, lo, hi):
+        """Approximate quantile, interpolating linearly inside a bin."""
+        total = sum(self.counts)
+        if not total:
+            return None
+        bounds = [lo] + self.edges + [hi]
+        target = q * total
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c and seen + c >= target:
+                left, right = max(bounds[i], lo), min(bounds[i + 1], hi)
+                return left + (right - left) * (target - seen) / c
+            seen += c
+        return hi
+
+
+class CategoryCounter:
+    """Category counts, capped so unbounded label sets cannot grow memory."""
+
+    OTHER = "__other__"
+
+    def __init__(self, known, max_categories=64):
+        self.known = set(known)
+        self.max_categories = max_categories
+        self.counts = {}
+
+    def add(self, value):
+        key = str(value)
+        if key not in self.counts and len(self.counts) >= self.max_categories:
+            key = self.OTHER
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def frequencies(self):
+        total = sum(self.counts.values())
+        return {k: c / total for k, c in self.counts.items()} if total else {}
+
+    def unseen_rate(self):
+        total = sum(self.counts.values())
+        unseen = sum(c for k, c in self.counts.items() if k not in self.known)
+        return unseen / total if total else 0.0
+
+
+def psi(expected, actual, floor=1e-4):
+    """Population stability index between two lists of bin fractions."""
+    total = 0.0
+    for e, a in zip(expected, actual):
+        e, a = max(e, floor), max(a, floor)
+        total += (a - e) * math.log(a / e)
+    return total
+
+
+# ---------------------------
+# Drift monitor
+# ---------------------------
+class DriftMonitor:
+    """Compares live records with the reference profile saved at training time.
+
+    Each observe() only updates the sketches; drift metrics are computed once
+    every `window` records (then the sketches reset), so the per-request cost
+    is O(1) amortized and memory stays constant. PSI is always reported but
+    only warned on once a feature has `min_rows` values in the window, since a
+    handful of rows against decile bins reads as drift.
+    """
+
+    def __init__(self, profile, window=500, psi_warn=0.1, psi_alert=0.25, missing_warn=0.05,
+                 min_rows=100):
+        self.profile = profile
+        self.window = window
+        self.min_rows = min_rows
+        self.psi_warn = psi_warn
+        self.psi_alert = psi_alert
+        self.missing_warn = missing_warn
+        self.windows_checked = 0
+        self.last_report = None
+        self._lock = threading.Lock()
+        # Raw categorical column -> (encoded feature, class index), to derive
+        # the encoded value when a record only carries the raw category
+        self.encodings = {
+            f: (ref["encoded_as"], crime_type_index(ref["classes"]))
+            for f, ref in profile["categorical"].items() if "encoded_as" in ref
+        }
+        self._reset()
+
+    def _reset(self):
+        numeric = self.profile["numeric"]
+        categorical = self.profile["categorical"]
+        self.seen = 0
+        self.missing = {f: 0 for f in list(numeric) + list(categorical)}
+        self.stats = {f: RunningStats() for f in numeric}
+        self.sketches = {f: BinnedSketch(numeric[f]["edges"]) for f in numeric}
+        self.categories = {
+            f: CategoryCounter(categorical[f]["frequencies"]) for f in categorical
+        }
+
+    def observe(self, record):
+        """Add one request record (a dict, before prepare() fills gaps).
+
+        The serving path should pass the encoded values it actually used
+        (None where it fell back to 0); otherwise they are derived here.
+        """
+        for f, (encoded, index) in self.encodings.items():
+            if encoded not in record:
+                record = dict(record, **{encoded: encode_crime_type(record.get(f), index)})
+        with self._lock:
+            self.seen += 1
+            for f, stats in self.stats.items():
+                try:
+                    x = float(record[f])
+                except (KeyError, TypeError, ValueError):
+                    self.missing[f] += 1
+                    continue
+                if not math.isfinite(x):
+                    self.missing[f] += 1
+                    continue
+                stats.add(x)
+                self.sketches[f].add(x)
+            for f, counter in self.categories.items():
+                value = record.get(f)
+                if value in (None, ""):
+                    self.missing[f] += 1
+                else:
+                    counter.add(value)
+            if self.seen >= self.window:
+                self._check()
+
+    def flush(self):
+        """Force a check on the partial window (e.g. at the end of a batch)."""
+        with self._lock:
+            if self.seen:
+                self._check()
+        return self.last_report
+
+    def report(self):
+        return self.last_report
+
+    def _check(self):
+        numeric, warnings = {}, []
+        for f, ref in self.profile["numeric"].items():
+            stats, sketch = self.stats[f], self.sketches[f]
+            missing_rate = self.missing[f] / self.seen
+            entry = {"missing_rate": missing_rate, "count": stats.count}
+            if stats.count:
+                shift = (stats.mean - ref["mean"]) / ref["std"] if ref["std"] else 0.0
+                entry.update({
+                    "mean": stats.mean,
+                    "std": stats.std,
+                    "mean_shift_std": shift,
+                    "psi": psi(ref["fractions"], sketch.fractions()),
+                    "p50": sketch.quantile(0.5, stats.min, stats.max),
+                    "ref_mean": ref["mean"],
+                    "ref_std": ref["std"],
+                })
+                if stats.count < self.min_rows:
+                    pass
+                elif entry["psi"] >= self.psi_alert:
+                    warnings.append(f"{f}: major drift (PSI {entry['psi']:.3f})")
+                elif entry["psi"] >= self.psi_warn:
+                    warnings.append(f"{f}: moderate drift (PSI {entry['psi']:.3f})")
+            if missing_rate > self.missing_warn:
+                warnings.append(f"{f}: missing in {missing_rate:.0%} of rows (filled with 0)")
+            numeric[f] = entry
+
+        categorical = {}
+        for f, ref in self.profile["categorical"].items():
+            counter = self.categories[f]
+            missing_rate = self.missing[f] / self.seen
+            live = counter.frequencies()
+            keys = sorted(set(ref["frequencies"]) | set(live))
+            entry = {
+                "missing_rate": missing_rate,
+                "unseen_rate": counter.unseen_rate(),
+                "frequencies": live,
+                "psi": psi([ref["frequencies"].get(k, 0.0) for k in keys],
+                           [live.get(k, 0.0) for k in keys]) if live else None,
+            }
+            enough = sum(counter.counts.values()) >= self.min_rows
+            if enough and entry["psi"] is not None and entry["psi"] >= self.psi_warn:
+                warnings.append(f"{f}: category mix drift (PSI {entry['psi']:.3f})")
+            if entry["unseen_rate"] > self.missing_warn:
+                warnings.append(f"{f}: {entry['unseen_rate']:.0%} unseen categories")
+            if missing_rate > self.missing_warn:
+                warnings.append(f"{f}: missing in {missing_rate:.0%} of rows")
+            if "encoded_as" in ref:
+                observed = self.seen - self.missing[f]
+                fallback = (self.missing[f] + entry["unseen_rate"] * observed) / self.seen
+                entry["zero_encoded_rate"] = fallback
+                if fallback > self.missing_warn:
+                    warnings.append(
+                        f"{f}: missing or unknown in {fallback:.0%} of rows; "
+                        f"{ref['encoded_as']} set to 0 ('{ref['classes'][0]}')"
+                    )
+            categorical[f] = entry
+
+        self.windows_checked += 1
+        self.last_report = {
+            "window": self.windows_checked,
+            "rows": self.seen,
+            "numeric": numeric,
+            "categorical": categorical,
+            "warnings": warnings,
+        }
+        for w in warnings:
+            logger.warning("Drift (window %d): %s", self.windows_checked, w)
+        self._reset()
+
+
+def load_profile(path=PROFILE_PATH):
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,152 @@
+import contextlib
+import csv
+import heapq
+import os
+import sys
+
+import numpy as np
+
+from features import crime_type_index, encode_crime_type, with_time_features
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARRAYS_PATH = os.path.join(BASE_DIR, "models", "crime_hotspot_model.npz")
+# Rows scored per predict_proba call; bounds the rows x trees node arrays
+CHUNK_SIZE = 4096
+
+
+# ---------------------------
+# NumPy-only hotspot model
+# ---------------------------
+class ArrayModel:
+    """Scores rows with the forest exported by train_model.export_model_arrays.
+
+    Needs nothing beyond NumPy, so CLI scoring jobs skip the pandas/sklearn
+    import and the pickle load entirely.
+    """
+
+    def __init__(self, path=ARRAYS_PATH):
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"❌ Model arrays not found: {path} (run `python cli.py train` first)"
+            )
+        with np.load(path) as arrays:
+            self.features = [str(f) for f in arrays["features"]]
+            self.crime_types = crime_type_index(arrays["crime_types"])
+            self.mean = arrays["scaler_mean"]
+            self.scale = arrays["scaler_scale"]
+            self.roots = arrays["roots"]
+            self.left = arrays["left"]
+            self.right = arrays["right"]
+            self.feature = arrays["feature"]
+            self.threshold = arrays["threshold"]
+            self.leaf_proba = arrays["leaf_proba"]
+            self.max_depth = int(arrays["max_depth"])
+
+    def predict_proba(self, X):
+        """Hotspot probability for each row of the raw (unscaled) matrix X."""
+        X = (np.asarray(X, dtype=np.float64) - self.mean) / self.scale
+        # sklearn trees compare float32 inputs against their thresholds
+        X = X.astype(np.float32).astype(np.float64)
+
+        rows = np.arange(len(X))[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), len(self.roots))).copy()
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.leaf_proba[nodes].mean(axis=1)
+
+
+# ---------------------------
+# CSV rows -> feature matrix
+# ---------------------------
+def row_features(row, model):
+    """Build one feature vector from a CSV row.
+
+    Accepts either pre-derived hour/day_of_week columns or a raw ISO `time`
+    column, the same layout as data/crime_data.csv. Empty cells become 0;
+    unparseable ones become NaN so score_file can count them before zeroing.
+    """
+    row = with_time_features(row)
+    values = {
+        "latitude": row.get("latitude"),
+        "longitude": row.get("longitude"),
+        "hour": row.get("hour"),
+        "day_of_week": row.get("day_of_week"),
+        "crime_type_encoded": encode_crime_type(row.get("crime_type"), model.crime_types),
+    }
+    return [_to_float(values[f]) for f in model.features]
+
+
+def _to_float(value):
+    if value in (None, ""):
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def score_file(input_path, output_path=None, topn=None, model_path=ARRAYS_PATH, chunk_size=CHUNK_SIZE):
+    """Score a CSV in fixed-size chunks so memory does not grow with the file.
+
+    Without `topn` each chunk is written as soon as it is scored; with it only
+    the best `topn` rows are kept, in a bounded heap. Returns the rows scored.
+    """
+    model = ArrayModel(model_path)
+    n_rows = unknown = invalid = 0
+    best = []  # min-heap of (score, -row_number, row)
+
+    # Input first, so a bad input path never truncates an existing output file
+    with open(input_path, newline="") as f_in, (
+        open(output_path, "w", newline="") if output_path else contextlib.nullcontext(sys.stdout)
+    ) as f_out:
+        reader = csv.DictReader(f_in)
+        writer = csv.DictWriter(f_out, fieldnames=list(reader.fieldnames or []) + ["risk_score"])
+        writer.writeheader()
+
+        for chunk in _chunks(reader, chunk_size):
+            unknown += sum(
+                encode_crime_type(row.get("crime_type"), model.crime_types) is None for row in chunk
+            )
+            X = np.array([row_features(row, model) for row in chunk], dtype=np.float64)
+            # Same as the API's pd.to_numeric(errors='coerce').fillna(0)
+            bad = ~np.isfinite(X)
+            invalid += int(bad.sum())
+            X[bad] = 0.0
+            scores = model.predict_proba(X)
+            for row, score in zip(chunk, scores):
+                row["risk_score"] = f"{score:.6f}"
+                if topn is not None:
+                    item = (score, -n_rows, row)
+                    if len(best) < topn:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+                n_rows += 1
+            if topn is None:
+                writer.writerows(chunk)
+
+        if topn is not None:
+            writer.writerows(row for _, _, row in sorted(best, reverse=True))
+
+    if unknown:
+        code0 = next(iter(model.crime_types), "?")
+        print(
+            f"⚠️ {unknown} of {n_rows} rows have a missing or unknown crime_type; "
+            f"scored as '{code0}' (code 0)",
+            file=sys.stderr,
+        )
+    if invalid:
+        print(f"⚠️ {invalid} non-numeric feature values were scored as 0", file=sys.stderr)
+    return n_rows
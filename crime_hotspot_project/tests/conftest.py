@@ -0,0 +1,20 @@
+import pytest
+
+
+@pytest.fixture
+def profile():
+    """Small reference profile: x uniform over 0..10 in five equal bins."""
+    return {
+        "rows": 100,
+        "numeric": {
+            "x": {"mean": 5.0, "std": 2.0, "edges": [2.0, 4.0, 6.0, 8.0], "fractions": [0.2] * 5},
+            "crime_type_encoded": {"mean": 0.5, "std": 0.5, "edges": [0.5], "fractions": [0.5, 0.5]},
+        },
+        "categorical": {
+            "crime_type": {
+                "frequencies": {"assault": 0.5, "theft": 0.5},
+                "encoded_as": "crime_type_encoded",
+                "classes": ["assault", "theft"],
+            },
+        },
+    }
@@ -0,0 +1,45 @@
+import pytest
+
+import app.app as api
+from monitoring import DriftMonitor
+
+
+@pytest.fixture
+def client():
+    return api.app.test_client()
+
+
+def test_predict_hotspots_scores_training_features(client):
+    rows = [
+        {"latitude": 12.9345, "longitude": 77.6101, "hour": 22, "day_of_week": 4, "crime_type": "theft"},
+        {"latitude": 12.94, "longitude": 77.595, "time": "2025-06-07T04:00:00"},
+    ]
+    r = client.post("/api/predict_hotspots", json=rows)
+    assert r.status_code == 200
+    body = r.get_json()
+    assert len(body) == 2
+    assert all(0.0 <= row["risk_score"] <= 1.0 for row in body)
+
+
+def test_drift_without_profile_is_404(client, monkeypatch):
+    monkeypatch.setitem(api._artifacts, "monitor", None)
+    assert client.get("/api/drift").status_code == 404
+
+
+def test_drift_reports_live_traffic(client, monkeypatch, profile):
+    profile["numeric"]["hour"] = {"mean": 12.0, "std": 6.0, "edges": [12.0], "fractions": [0.5, 0.5]}
+    monitor = DriftMonitor(profile, window=2)
+    monkeypatch.setitem(api._artifacts, "monitor", monitor)
+
+    assert client.get("/api/drift").get_json() == {"rows": 0, "warnings": []}
+
+    client.post("/api/predict_hotspots", json=[
+        {"latitude": 12.93, "longitude": 77.61, "hour": 3, "day_of_week": 2},
+        {"latitude": 12.93, "longitude": 77.61, "hour": 4, "day_of_week": 2, "crime_type": "theft"},
+    ])
+    report = client.get("/api/drift").get_json()
+    assert report["rows"] == 2
+    assert report["numeric"]["hour"]["mean"] == pytest.approx(3.5)
+    # The API passes the code it actually used: None for the row without crime_type
+    assert report["numeric"]["crime_type_encoded"]["missing_rate"] == pytest.approx(0.5)
+    assert report["categorical"]["crime_type"]["zero_encoded_rate"] == pytest.approx(0.5)
@@ -0,0 +1,45 @@
+import os
+
+import cli
+
+
+def test_build_parser_wires_commands():
+    parser = cli.build_parser()
+
+    args = parser.parse_args(["score-file", "in.csv", "--topn", "5"])
+    assert args.func is cli.cmd_score_file
+    assert (args.input, args.output, args.topn) == ("in.csv", None, 5)
+    assert args.model == os.path.join(cli.BASE_DIR, "models", "crime_hotspot_model.npz")
+
+    args = parser.parse_args(["train"])
+    assert args.func is cli.cmd_train
+    assert args.data == os.path.join(cli.BASE_DIR, "data", "crime_data.csv")
+
+    args = parser.parse_args(["bench", "serve", "--repeat", "1"])
+    assert (args.func, args.commands, args.repeat) == (cli.cmd_bench, ["serve"], 1)
+
+    args = parser.parse_args(["drift", "live.csv"])
+    assert (args.func, args.window, args.min_rows) == (cli.cmd_drift, 500, 100)
+
+
+def test_parse_importtime():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     numpy._utils",
+        "import time:      3000 |       3120 |   numpy",
+        "import time:       500 |       3620 | scoring",
+        "import time:        40 |         40 | csv",
+        "Traceback (most recent call last):",
+        "ValueError: boom",
+    ])
+    self_us, top_level, other = cli.parse_importtime(stderr)
+    assert self_us == 3660
+    assert top_level == [(3620, "scoring"), (40, "csv")]
+    assert other[-1] == "ValueError: boom"
+
+
+def test_run_probe_score_file():
+    result = cli.run_probe("score-file")
+    assert result["ok"], result["error"]
+    assert result["imports"] > 0
+    assert any(mod == "scoring" for _, mod in result["top"])
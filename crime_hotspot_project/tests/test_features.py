@@ -0,0 +1,31 @@
+from features import crime_type_index, encode_crime_type, with_time_features
+
+TIME = "2025-06-07T04:00:00"  # a Saturday
+
+
+def test_with_time_features_fills_both_from_time():
+    row = {"time": TIME}
+    assert with_time_features(row) == {"time": TIME, "hour": 4, "day_of_week": 5}
+    assert row == {"time": TIME}
+
+
+def test_with_time_features_keeps_supplied_values():
+    assert with_time_features({"time": TIME, "hour": "22"}) == {"time": TIME, "hour": "22", "day_of_week": 5}
+    assert with_time_features({"time": TIME, "day_of_week": 0, "hour": ""}) == {
+        "time": TIME, "hour": 4, "day_of_week": 0,
+    }
+    row = {"time": TIME, "hour": 1, "day_of_week": 2}
+    assert with_time_features(row) is row
+
+
+def test_with_time_features_ignores_missing_or_bad_time():
+    for row in ({"hour": 3}, {"time": ""}, {"time": "not a time"}):
+        assert with_time_features(row) is row
+
+
+def test_encode_crime_type():
+    index = crime_type_index(["assault", "theft"])
+    assert encode_crime_type("theft", index) == 1
+    assert encode_crime_type("arson", index) is None
+    for missing in (None, "", float("nan")):
+        assert encode_crime_type(missing, index) is None
@@ -0,0 +1,124 @@
+import json
+import statistics
+
+import pytest
+
+from monitoring import BinnedSketch, CategoryCounter, DriftMonitor, RunningStats, psi
+
+
+def reference_rows(n):
+    """Rows that follow the test profile exactly."""
+    return [{"x": (i % 10) + 0.5, "crime_type": ["assault", "theft"][i % 2]} for i in range(n)]
+
+
+def test_running_stats_matches_statistics():
+    values = [3.0, 1.5, 8.25, -2.0, 4.0]
+    stats = RunningStats()
+    for v in values:
+        stats.add(v)
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.std == pytest.approx(statistics.stdev(values))
+    assert (stats.min, stats.max) == (-2.0, 8.25)
+
+
+def test_binned_sketch_quantile_on_uniform_values():
+    sketch = BinnedSketch([25, 50, 75])
+    assert sketch.quantile(0.5, 0, 99) is None
+    for v in range(100):
+        sketch.add(v)
+    assert sketch.counts == [25, 25, 25, 25]
+    assert sketch.quantile(0.1, 0, 99) == pytest.approx(10.0)
+    assert sketch.quantile(0.5, 0, 99) == pytest.approx(50.0)
+    assert sketch.quantile(0.9, 0, 99) == pytest.approx(89.4)
+    assert sketch.fractions() == [0.25] * 4
+
+
+def test_category_counter_spills_into_other():
+    counter = CategoryCounter(known=["a"], max_categories=2)
+    for value in ["a", "b", "c", "d", "a"]:
+        counter.add(value)
+    assert counter.counts == {"a": 2, "b": 1, CategoryCounter.OTHER: 2}
+    assert counter.unseen_rate() == pytest.approx(3 / 5)
+
+
+def test_psi():
+    assert psi([0.2] * 5, [0.2] * 5) == 0.0
+    assert psi([0.2] * 5, [1.0, 0, 0, 0, 0]) > 0.25
+
+
+def test_window_check_resets_sketches(profile):
+    monitor = DriftMonitor(profile, window=10)
+    for row in reference_rows(10):
+        monitor.observe(row)
+
+    report = monitor.report()
+    assert (report["window"], report["rows"]) == (1, 10)
+    assert report["warnings"] == []
+    assert report["numeric"]["x"]["psi"] == pytest.approx(0.0)
+    assert monitor.seen == 0
+    assert sum(monitor.sketches["x"].counts) == 0
+    assert monitor.stats["x"].count == 0
+    assert monitor.categories["crime_type"].counts == {}
+
+
+def test_missing_unseen_and_zero_encoded_rates(profile):
+    monitor = DriftMonitor(profile, window=100)
+    rows = reference_rows(6) + [
+        {"crime_type": "arson", "x": "inf"},
+        {"x": None},
+        {"x": "not a number", "crime_type": ""},
+        {"x": 1.0, "crime_type": "arson"},
+    ]
+    for row in rows:
+        monitor.observe(row)
+    report = monitor.flush()
+
+    x = report["numeric"]["x"]
+    assert x["missing_rate"] == pytest.approx(3 / 10)
+    assert x["count"] == 7
+    crime_type = report["categorical"]["crime_type"]
+    assert crime_type["missing_rate"] == pytest.approx(2 / 10)
+    assert crime_type["unseen_rate"] == pytest.approx(2 / 8)
+    assert crime_type["zero_encoded_rate"] == pytest.approx(4 / 10)
+    # Derived from crime_type when the record does not carry it
+    assert report["numeric"]["crime_type_encoded"]["missing_rate"] == pytest.approx(4 / 10)
+    assert any("crime_type_encoded set to 0" in w for w in report["warnings"])
+    assert any(w.startswith("x: missing in 30%") for w in report["warnings"])
+    # Non-finite input must not leak NaN into the report
+    json.dumps(report, allow_nan=False)
+
+
+def test_flush_checks_partial_window_only_when_rows_seen(profile):
+    monitor = DriftMonitor(profile, window=100)
+    assert monitor.flush() is None
+
+    for row in reference_rows(4):
+        monitor.observe(row)
+    report = monitor.flush()
+    assert (report["window"], report["rows"]) == (1, 4)
+    assert monitor.flush() is report
+
+
+def test_shifted_traffic_warns(profile):
+    monitor = DriftMonitor(profile, window=50, min_rows=50)
+    for _ in range(50):
+        monitor.observe({"x": 9.5, "crime_type": "theft", "crime_type_encoded": 1})
+    warnings = monitor.report()["warnings"]
+    assert any(w.startswith("x: major drift") for w in warnings)
+    assert any(w.startswith("crime_type: category mix drift") for w in warnings)
+
+
+def test_psi_reported_but_not_warned_below_min_rows(profile):
+    monitor = DriftMonitor(profile, window=500, min_rows=20)
+    monitor.observe({"x": 9.5, "crime_type": "theft"})
+    report = monitor.flush()
+
+    assert report["numeric"]["x"]["psi"] > 0.25
+    assert report["categorical"]["crime_type"]["psi"] > 0.1
+    assert report["warnings"] == []
+
+    for _ in range(20):
+        monitor.observe({"x": 9.5, "crime_type": "theft"})
+    warnings = monitor.flush()["warnings"]
+    assert any(w.startswith("x: major drift") for w in warnings)
+    assert any(w.startswith("crime_type: category mix drift") for w in warnings)
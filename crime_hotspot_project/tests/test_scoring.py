@@ -0,0 +1,117 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+import train_model
+from scoring import CHUNK_SIZE, ArrayModel, row_features, score_file
+
+
+@pytest.fixture(scope="module")
+def training_rows():
+    df = pd.read_csv(train_model.DATA_PATH).head(400)
+    df, encoder = train_model.preprocess_data(df)
+    X_raw = df[train_model.FEATURES].to_numpy(dtype=float)
+    # Synthetic target so the forest actually splits on every feature
+    y = ((df["hour"] >= 12) ^ (df["latitude"] > df["latitude"].median())).astype(int).to_numpy()
+    return X_raw, y, encoder
+
+
+def export_and_load(model, scaler, encoder, tmp_path):
+    path = train_model.export_model_arrays(model, scaler, encoder.classes_, str(tmp_path))
+    assert os.path.exists(path)
+    return ArrayModel(path)
+
+
+def test_array_model_matches_predict_proba(training_rows, tmp_path):
+    X_raw, y, encoder = training_rows
+    scaler = StandardScaler().fit(X_raw)
+    model = RandomForestClassifier(n_estimators=25, random_state=0).fit(scaler.transform(X_raw), y)
+
+    arrays = export_and_load(model, scaler, encoder, tmp_path)
+
+    expected = model.predict_proba(scaler.transform(X_raw))[:, 1]
+    assert np.allclose(arrays.predict_proba(X_raw), expected)
+    # Unseen rows, including values outside the training range
+    X_new = X_raw[:50] + np.random.default_rng(0).normal(0, 0.01, X_raw[:50].shape)
+    X_new[0] = [0.0, 0.0, 99, -1, 42]
+    assert np.allclose(arrays.predict_proba(X_new), model.predict_proba(scaler.transform(X_new))[:, 1])
+
+
+@pytest.mark.parametrize("label", [0, 1])
+def test_array_model_single_class(training_rows, tmp_path, label):
+    X_raw, y, encoder = training_rows
+    scaler = StandardScaler().fit(X_raw)
+    model = RandomForestClassifier(n_estimators=5, random_state=0).fit(
+        scaler.transform(X_raw), np.full(len(y), label)
+    )
+
+    arrays = export_and_load(model, scaler, encoder, tmp_path)
+
+    # predict_proba has a single column for the only class seen in training
+    proba = model.predict_proba(scaler.transform(X_raw))[:, 0]
+    expected = proba if label == 1 else np.zeros(len(X_raw))
+    assert np.allclose(arrays.predict_proba(X_raw), expected)
+
+
+# ---------------------------
+# score_file on a small CSV (uses the shipped models/crime_hotspot_model.npz)
+# ---------------------------
+@pytest.fixture
+def incidents_csv(tmp_path):
+    df = pd.read_csv(train_model.DATA_PATH, dtype=str).head(30)
+    # Duplicated rows score identically, so --topn has ties to break
+    df = pd.concat([df, df.head(10)], ignore_index=True)
+    df.loc[3, "crime_type"] = "arson"
+    df.loc[4, "crime_type"] = None
+    df.loc[5, "latitude"] = "abc"
+    path = tmp_path / "incidents.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def read_scores(path):
+    return pd.read_csv(path, keep_default_na=False, dtype=str)
+
+
+def test_score_file_output_does_not_depend_on_chunk_size(incidents_csv, tmp_path):
+    outputs = []
+    for chunk_size in (1, 7, CHUNK_SIZE):
+        out = tmp_path / f"scored_{chunk_size}.csv"
+        assert score_file(str(incidents_csv), str(out), chunk_size=chunk_size) == 40
+        outputs.append(out.read_bytes())
+    assert outputs[0] == outputs[1] == outputs[2]
+
+    scored = read_scores(tmp_path / "scored_1.csv")
+    assert list(scored.columns) == list(read_scores(incidents_csv).columns) + ["risk_score"]
+    assert len(scored) == 40
+
+
+def test_score_file_topn_matches_stable_full_sort(incidents_csv, tmp_path):
+    full, top = tmp_path / "full.csv", tmp_path / "top.csv"
+    score_file(str(incidents_csv), str(full))
+    assert score_file(str(incidents_csv), str(top), topn=15, chunk_size=4) == 40
+
+    scored = read_scores(full)
+    scores = scored["risk_score"].astype(float)
+    assert scores.duplicated().any()
+    expected = scored.loc[scores.sort_values(ascending=False, kind="stable").index[:15]]
+    pd.testing.assert_frame_equal(read_scores(top), expected.reset_index(drop=True))
+
+
+def test_score_file_reports_unknown_types_and_bad_values(incidents_csv, tmp_path, capsys):
+    score_file(str(incidents_csv), str(tmp_path / "out.csv"))
+    err = capsys.readouterr().err
+    assert "2 of 40 rows have a missing or unknown crime_type" in err
+    assert "1 non-numeric feature values were scored as 0" in err
+
+
+def test_row_features_derives_time_fields():
+    model = ArrayModel()
+    raw = {"latitude": "12.93", "longitude": "77.61", "time": "2025-06-07T04:00:00", "crime_type": "theft"}
+    derived = {"latitude": "12.93", "longitude": "77.61", "hour": "4", "day_of_week": "5", "crime_type": "theft"}
+    assert row_features(raw, model) == row_features(derived, model)
+    assert row_features(raw, model) == [12.93, 77.61, 4.0, 5.0, float(model.crime_types["theft"])]
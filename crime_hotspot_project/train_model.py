@@ -5,12 +5,19 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 import joblib
+import json
 import os
 
+from features import FEATURES, PROFILE_CATEGORICAL
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(BASE_DIR, "data", "crime_data.csv")
+MODEL_DIR = os.path.join(BASE_DIR, "models")
+
 # ================================================================
 # STEP 1: Load Data
 # ================================================================
-def load_data(file_path="data/crime_data.csv"):
+def load_data(file_path=DATA_PATH):
     print("Loading data...")
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"❌ File not found: {file_path}")
@@ -41,7 +48,7 @@ def preprocess_data(df):
     df["hour"] = df["hour"].fillna(df["hour"].median())
     df["day_of_week"] = df["day_of_week"].fillna(df["day_of_week"].median())
 
-    return df
+    return df, encoder
 
 
 # ================================================================
@@ -69,7 +76,7 @@ def prepare_dataset(df):
 
     df["is_hotspot"] = (df["cluster"] != -1).astype(int)
 
-    X = df[["latitude", "longitude", "hour", "day_of_week", "crime_type_encoded"]]
+    X = df[FEATURES]
     y = df["is_hotspot"]
 
     scaler = StandardScaler()
@@ -111,23 +118,106 @@ def train_model(X, y):
 # ================================================================
 # STEP 6: Save Model and Scaler
 # ================================================================
-def save_model(model, scaler):
-    os.makedirs("models", exist_ok=True)
-    joblib.dump(model, "models/crime_hotspot_model.pkl")
-    joblib.dump(scaler, "models/scaler.pkl")
-    print("💾 Model and scaler saved in /models folder.")
+def save_model(model, scaler, encoder, model_dir=MODEL_DIR):
+    os.makedirs(model_dir, exist_ok=True)
+    joblib.dump(model, os.path.join(model_dir, "crime_hotspot_model.pkl"))
+    joblib.dump(scaler, os.path.join(model_dir, "scaler.pkl"))
+    joblib.dump(encoder, os.path.join(model_dir, "encoder.pkl"))
+    print(f"💾 Model, scaler and encoder saved in {model_dir}")
+
+
+def export_model_arrays(model, scaler, crime_types, model_dir=MODEL_DIR):
+    """Flatten the forest and scaler into plain NumPy arrays for scoring.py.
+
+    All trees are concatenated into one node table; leaves point back at
+    themselves so every sample can be walked down every tree in lockstep.
+    """
+    trees = [est.tree_ for est in model.estimators_]
+    offsets = np.cumsum([0] + [t.node_count for t in trees[:-1]])
+
+    if 1 in model.classes_:
+        pos = int(np.flatnonzero(model.classes_ == 1)[0])
+    else:
+        pos = None
+
+    left, right, feature, threshold, leaf_proba = [], [], [], [], []
+    for tree, off in zip(trees, offsets):
+        ids = np.arange(tree.node_count)
+        is_leaf = tree.children_left == -1
+        left.append(np.where(is_leaf, ids, tree.children_left) + off)
+        right.append(np.where(is_leaf, ids, tree.children_right) + off)
+        feature.append(np.where(is_leaf, 0, tree.feature))
+        threshold.append(np.where(is_leaf, np.inf, tree.threshold))
+        value = tree.value[:, 0, :]
+        proba = value / value.sum(axis=1, keepdims=True)
+        leaf_proba.append(proba[:, pos] if pos is not None else np.zeros(tree.node_count))
+
+    path = os.path.join(model_dir, "crime_hotspot_model.npz")
+    os.makedirs(model_dir, exist_ok=True)
+    np.savez(
+        path,
+        features=np.array(FEATURES),
+        crime_types=np.asarray(crime_types, dtype=str),
+        scaler_mean=scaler.mean_,
+        scaler_scale=scaler.scale_,
+        roots=offsets.astype(np.int64),
+        left=np.concatenate(left).astype(np.int64),
+        right=np.concatenate(right).astype(np.int64),
+        feature=np.concatenate(feature).astype(np.int64),
+        threshold=np.concatenate(threshold).astype(np.float64),
+        leaf_proba=np.concatenate(leaf_proba).astype(np.float64),
+        max_depth=np.int64(max(t.max_depth for t in trees)),
+    )
+    print(f"💾 NumPy model arrays exported to {path}")
+    return path
+
+
+def save_reference_profile(df, encoder, model_dir=MODEL_DIR):
+    """Save per-feature training distributions for monitoring.DriftMonitor.
+
+    The scaler's inputs (FEATURES) keep mean/std plus decile bin edges and the
+    fraction of rows in each bin; raw categorical columns keep their
+    frequencies, the encoded feature they feed and the encoder's classes.
+    """
+    profile = {"rows": int(len(df)), "numeric": {}, "categorical": {}}
+    for col in FEATURES:
+        values = df[col].dropna().to_numpy(dtype=float)
+        edges = np.unique(np.quantile(values, np.linspace(0.1, 0.9, 9)))
+        counts = np.bincount(np.searchsorted(edges, values, side="right"), minlength=len(edges) + 1)
+        profile["numeric"][col] = {
+            "mean": float(values.mean()),
+            "std": float(values.std(ddof=1)),
+            "edges": edges.tolist(),
+            "fractions": (counts / counts.sum()).tolist(),
+        }
+    for col, encoded in PROFILE_CATEGORICAL.items():
+        freqs = df[col].astype(str).value_counts(normalize=True)
+        profile["categorical"][col] = {
+            "frequencies": {k: float(v) for k, v in freqs.items()},
+            "encoded_as": encoded,
+            "classes": [str(c) for c in encoder.classes_],
+        }
+
+    path = os.path.join(model_dir, "reference_profile.json")
+    os.makedirs(model_dir, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(profile, f, indent=2)
+    print(f"💾 Reference profile saved to {path}")
+    return path
 
 
 # ================================================================
 # STEP 7: Main Flow
 # ================================================================
-def main():
-    df = load_data()
-    df = preprocess_data(df)
+def main(data_path=DATA_PATH, model_dir=MODEL_DIR):
+    df = load_data(data_path)
+    df, encoder = preprocess_data(df)
+    save_reference_profile(df, encoder, model_dir)
     df = cluster_hotspots(df)
     X, y, scaler = prepare_dataset(df)
     model = train_model(X, y)
-    save_model(model, scaler)
+    save_model(model, scaler, encoder, model_dir)
+    export_model_arrays(model, scaler, encoder.classes_, model_dir)
     print("🎯 Training pipeline complete.")
 
 